@@ -1,18 +1,16 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, send_file
 from flask_cors import CORS
-import json
-import sys
 import os
+import atexit
+import uuid
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from campus_graph import CampusGraph, Node, Edge, AccessibilityFeature, SurfaceType
-from pathfinding import MultiCriteriaRouter, RoutingPreference
+from campus_nav.campus_graph import CampusGraph, Node, Edge, AccessibilityFeature, SurfaceType
+from campus_nav.pathfinding import MultiCriteriaRouter, RoutingPreference
+from campus_nav.persistence import PersistenceWriter
 
 app = Flask(__name__)
 CORS(app)
@@ -21,21 +19,38 @@ CORS(app)
 CAMPUS_DATA_FILE = "data/north_terrace_campus.json"
 campus_graph = None
 router = None
+persistence_writer = None
+
+# Graph revisions restart with every process, so ETags also carry an id unique to this one;
+# otherwise a client's tag from before a restart (or from another worker) could match new data
+BOOT_ID = uuid.uuid4().hex
 
 
 def load_campus_data():
     """Load campus data from file"""
-    global campus_graph, router
+    global campus_graph, router, persistence_writer
     try:
         campus_graph = CampusGraph.load_from_file(CAMPUS_DATA_FILE)
         router = MultiCriteriaRouter(campus_graph)
         print(f"Loaded campus data: {campus_graph.get_statistics()}")
     except FileNotFoundError:
         print("Campus data file not found. Creating sample data...")
-        from sample_data import create_sample_campus
+        from campus_nav.sample_data import create_sample_campus
         campus_graph = create_sample_campus()
         campus_graph.save_to_file(CAMPUS_DATA_FILE)
         router = MultiCriteriaRouter(campus_graph)
+    
+    # Build the routing snapshot before the first request rather than during it
+    campus_graph.freeze()
+    persistence_writer = PersistenceWriter(campus_graph, CAMPUS_DATA_FILE)
+    atexit.register(persistence_writer.close)
+
+
+def revisioned_json(revision: int, payload: bytes) -> Response:
+    """JSON response tagged with the graph revision; answers 304 if the client copy is current"""
+    response = Response(payload, mimetype='application/json')
+    response.set_etag(f"{BOOT_ID}-rev{revision}", weak=True)
+    return response.make_conditional(request)
 
 
 # === API Endpoints ===
@@ -54,8 +69,10 @@ def get_config():
 
 @app.route('/api/nodes', methods=['GET'])
 def get_nodes():
-    nodes = [node.to_dict() for node in campus_graph.nodes.values()]
-    return jsonify(nodes)
+    # Read the revision before the payload: an edit in between leaves the ETag older than the
+    # body, which only costs the client a refetch, never a 304 for stale data
+    revision = campus_graph.revision
+    return revisioned_json(revision, campus_graph.get_nodes_json())
 
 
 @app.route('/api/nodes/<node_id>', methods=['GET'])
@@ -71,9 +88,11 @@ def add_node():
     try:
         data = request.json
         node = Node.from_dict(data)
-        campus_graph.add_node(node)
-        campus_graph.save_to_file(CAMPUS_DATA_FILE)
-        return jsonify({"success": True, "node": node.to_dict()}), 201
+        with campus_graph.lock:
+            campus_graph.add_node(node)
+            node_dict = node.to_dict()
+        persistence_writer.schedule_save()
+        return jsonify({"success": True, "node": node_dict}), 201
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
@@ -84,9 +103,12 @@ def add_edge():
     try:
         data = request.json
         edge = Edge.from_dict(data)
-        campus_graph.add_edge(edge)
-        campus_graph.save_to_file(CAMPUS_DATA_FILE)
-        return jsonify({"success": True, "edge": edge.to_dict()}), 201
+        with campus_graph.lock:
+            campus_graph.add_edge(edge)
+            # Memoized on the edge, so build it before a concurrent block/unblock can interleave
+            edge_dict = edge.to_dict()
+        persistence_writer.schedule_save()
+        return jsonify({"success": True, "edge": edge_dict}), 201
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
@@ -100,12 +122,13 @@ def find_route():
         preference_str = data.get('preference', 'balanced')
         max_slope = data.get('max_slope', 8.0)
         min_width = data.get('min_width', 1.2)
+        epsilon = data.get('epsilon', 1.0)
         
         # Convert preference string to enum
         preference = RoutingPreference(preference_str.lower())
         
         # Find route
-        route = router.find_route(start, end, preference, max_slope, min_width)
+        route = router.find_route(start, end, preference, max_slope, min_width, epsilon)
         
         if route is None:
             return jsonify({"error": "No accessible route found"}), 404
@@ -123,8 +146,9 @@ def find_alternative_routes():
         start = data.get('start')
         end = data.get('end')
         num_alternatives = data.get('num_alternatives', 3)
+        epsilon = data.get('epsilon', 1.0)
         
-        routes = router.find_alternative_routes(start, end, num_alternatives)
+        routes = router.find_alternative_routes(start, end, num_alternatives, epsilon)
         
         result = [
             {
@@ -154,10 +178,11 @@ def block_path():
             from datetime import datetime
             until = datetime.fromisoformat(until_str)
         
-        success = campus_graph.mark_path_blocked(from_node, to_node, reason, until)
+        with campus_graph.lock:
+            success = campus_graph.mark_path_blocked(from_node, to_node, reason, until)
         
         if success:
-            campus_graph.save_to_file(CAMPUS_DATA_FILE)
+            persistence_writer.schedule_save()
             return jsonify({"success": True})
         else:
             return jsonify({"error": "Path not found"}), 404
@@ -174,10 +199,11 @@ def unblock_path():
         from_node = data.get('from_node')
         to_node = data.get('to_node')
         
-        success = campus_graph.mark_path_accessible(from_node, to_node)
+        with campus_graph.lock:
+            success = campus_graph.mark_path_accessible(from_node, to_node)
         
         if success:
-            campus_graph.save_to_file(CAMPUS_DATA_FILE)
+            persistence_writer.schedule_save()
             return jsonify({"success": True})
         else:
             return jsonify({"error": "Path not found"}), 404
@@ -189,15 +215,32 @@ def unblock_path():
 @app.route('/api/statistics', methods=['GET'])
 def get_statistics():
     """Get campus statistics"""
-    return jsonify(campus_graph.get_statistics())
+    revision = campus_graph.revision
+    return revisioned_json(revision, campus_graph.get_statistics_json())
 
 
 @app.route('/api/export', methods=['GET'])
 def export_data():
     """Export complete campus data"""
-    with open(CAMPUS_DATA_FILE, 'r') as f:
-        data = json.load(f)
-    return jsonify(data)
+    # Make sure debounced edits are on disk before serving the file
+    persistence_writer.flush()
+    
+    data_file = os.path.abspath(CAMPUS_DATA_FILE)
+    gzip_file = data_file + '.gz'
+    if ('gzip' in request.accept_encodings and os.path.exists(gzip_file)
+            and os.path.getmtime(gzip_file) >= os.path.getmtime(data_file)):
+        response = send_file(gzip_file, mimetype='application/json', conditional=True,
+                             etag=True, last_modified=os.path.getmtime(gzip_file))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+    
+    # Saves replace the file atomically, so it is always a complete document
+    response = send_file(data_file, mimetype='application/json', conditional=True,
+                         etag=True, last_modified=os.path.getmtime(data_file))
+    # This URL also serves the gzip mirror, so caches must key on Accept-Encoding here too
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
 
 
 if __name__ == '__main__':
@@ -206,9 +249,12 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Accessible Campus Navigation Server')
     parser.add_argument('--port', type=int, default=8080, help='Port to run the server on (default: 8080)')
     parser.add_argument('--host', type=str, default='0.0.0.0', help='Host to run the server on (default: 0.0.0.0)')
+    parser.add_argument('--dev', action='store_true', help='Enable Flask debug mode and the auto-reloader')
     args = parser.parse_args()
     
     load_campus_data()
     print(f"\n🚀 Starting server on http://localhost:{args.port}")
+    if not args.dev:
+        print("   For production use a WSGI server: gunicorn -w 1 -k gthread --threads 8 wsgi:application")
     print(f"   Press Ctrl+C to stop\n")
-    app.run(debug=True, host=args.host, port=args.port)
+    app.run(debug=args.dev, host=args.host, port=args.port, threaded=True)
@@ -0,0 +1,3 @@
+"""
+Accessible campus navigation: campus graph model, routing and persistence
+"""
@@ -0,0 +1,791 @@
+"""
+Represent the campus as a weighted graph with accessibility features
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, NamedTuple, Set, Optional, Tuple, Union
+from collections import Counter
+from enum import Enum, IntEnum, IntFlag
+from array import array
+from heapq import nsmallest
+import math
+import os
+import sys
+import threading
+from datetime import datetime
+
+import orjson
+
+from .dijkstra_csr import dijkstra_csr
+
+
+class SurfaceType(IntEnum):
+    """Types of surface materials (stored as ints, named in JSON via SURFACE_NAMES)"""
+    SMOOTH_PAVEMENT = 0
+    ROUGH_PAVEMENT = 1
+    BRICK = 2
+    GRAVEL = 3
+    GRASS = 4
+    INDOOR_TILE = 5
+    INDOOR_CARPET = 6
+
+
+# JSON names indexed by surface id, and the reverse lookup used when loading
+SURFACE_NAMES = [s.name.lower() for s in SurfaceType]
+SURFACE_NAME_TO_ID = {name: SurfaceType(i) for i, name in enumerate(SURFACE_NAMES)}
+
+
+class AccessibilityFeature(IntFlag):
+    """Accessibility features along routes (one bit each, named in JSON via FEATURE_NAMES)"""
+    RAMP = 1 << 0
+    ELEVATOR = 1 << 1
+    AUTOMATIC_DOOR = 1 << 2
+    CURB_CUT = 1 << 3
+    REST_AREA = 1 << 4
+    ACCESSIBLE_BATHROOM = 1 << 5
+    SHELTERED = 1 << 6
+    WELL_LIT = 1 << 7
+    HANDRAILS = 1 << 8
+
+
+# Node.features and Edge.features hold OR-ed combinations of these bits as plain ints
+FEATURE_BITS = {f: int(f) for f in AccessibilityFeature}
+FEATURE_NAMES = {f: f.name.lower() for f in AccessibilityFeature}
+FEATURE_BY_NAME = {name: FEATURE_BITS[f] for f, name in FEATURE_NAMES.items()}
+# JSON feature names for every possible mask, so serialization is a single index
+FEATURE_NAMES_BY_MASK = tuple(
+    tuple(FEATURE_NAMES[f] for f, bit in FEATURE_BITS.items() if mask & bit)
+    for mask in range(1 << len(FEATURE_BITS))
+)
+_SHELTERED_BIT = FEATURE_BITS[AccessibilityFeature.SHELTERED]
+
+# Bits of CSRAdjacency.edge_flags
+EDGE_FLAG_SHELTERED = 1
+EDGE_FLAG_ACCESSIBLE = 2
+
+EARTH_RADIUS_M = 6371000
+
+
+def haversine_rad(lat1: float, lon1: float, cos_lat1: float, lat2: float, lon2: float, cos_lat2: float) -> float:
+    """Great-circle distance in meters between two points given in radians, with their cos(latitude)"""
+    a = math.sin((lat2 - lat1) / 2) ** 2 + cos_lat1 * cos_lat2 * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def features_to_mask(features: Union[int, Iterable[AccessibilityFeature]]) -> int:
+    """Pack a collection of features (or an AccessibilityFeature combination) into a plain int bitmask"""
+    if isinstance(features, int):
+        return int(features)
+    mask = 0
+    for feature in features:
+        mask |= FEATURE_BITS[feature]
+    return mask
+
+
+def mask_to_features(mask: int) -> List[AccessibilityFeature]:
+    """Unpack a bitmask into its features, in declaration order"""
+    return [f for f, bit in FEATURE_BITS.items() if mask & bit]
+
+
+def _json_default(obj):
+    """Fallback encoder for types orjson does not handle natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@dataclass(slots=True)
+class Node:
+    id: str
+    name: str
+    latitude: float
+    longitude: float
+    building: Optional[str] = None
+    floor: int = 0
+    features: int = 0  # bitmask of FEATURE_BITS
+    is_indoor: bool = False
+    notes: str = ""
+    # Memoized to_dict() output; cleared whenever the node is mutated
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Interned so id lookups and building comparisons are pointer checks, even for runtime-built strings
+        self.id = sys.intern(self.id)
+        self.name = sys.intern(self.name)
+        self.building = sys.intern(self.building) if self.building is not None else None
+        # Plain ints keep the bit tests in the search loops off IntFlag's Python-level operators
+        if type(self.features) is not int:
+            self.features = features_to_mask(self.features)
+    
+    def add_feature(self, feature: AccessibilityFeature) -> None:
+        self.features |= FEATURE_BITS[feature]
+        self._cached_dict = None
+    
+    def has_feature(self, feature: AccessibilityFeature) -> bool:
+        return bool(self.features & FEATURE_BITS[feature])
+    
+    def features_as_set(self) -> Set[AccessibilityFeature]:
+        return set(mask_to_features(self.features))
+    
+    def to_dict(self) -> dict:
+        """JSON-ready dict; the result is cached, so treat it as read-only"""
+        cached = self._cached_dict
+        if cached is not None:
+            return cached
+        cached = self._cached_dict = {
+            "id": self.id,
+            "name": self.name,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "building": self.building,
+            "floor": self.floor,
+            "features": FEATURE_NAMES_BY_MASK[self.features],
+            "is_indoor": self.is_indoor,
+            "notes": self.notes
+        }
+        return cached
+    
+    @staticmethod
+    def from_dict(data: dict) -> 'Node':
+        features = 0
+        for name in data.get("features", ()):
+            features |= FEATURE_BY_NAME[name]
+        
+        # Fill the slots directly; the fields are already normalized so __init__ has nothing to add
+        node = object.__new__(Node)
+        node.id = sys.intern(data["id"])
+        node.name = sys.intern(data["name"])
+        node.latitude = data["latitude"]
+        node.longitude = data["longitude"]
+        building = data.get("building")
+        node.building = sys.intern(building) if building is not None else None
+        node.floor = data.get("floor", 0)
+        node.features = features
+        node.is_indoor = data.get("is_indoor", False)
+        node.notes = data.get("notes", "")
+        node._cached_dict = None
+        return node
+
+
+@dataclass(slots=True)
+class Edge:
+    from_node: str
+    to_node: str
+    distance: float  
+    slope: float = 0.0  # percentage grade (positive = uphill, negative = downhill)
+    surface: int = SurfaceType.SMOOTH_PAVEMENT
+    width: float = 2.0 
+    is_bidirectional: bool = True
+    features: int = 0  # bitmask of FEATURE_BITS; the SHELTERED bit is the edge's shelter status
+    is_accessible: bool = True  # Can be set to False if blocked
+    blocked_reason: Optional[str] = None
+    blocked_until: Optional[datetime] = None
+    # Memoized to_dict() output; cleared whenever the edge is mutated
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if type(self.features) is not int:
+            self.features = features_to_mask(self.features)
+    
+    def add_feature(self, feature: AccessibilityFeature) -> None:
+        self.features |= FEATURE_BITS[feature]
+        self._cached_dict = None
+    
+    def has_feature(self, feature: AccessibilityFeature) -> bool:
+        return bool(self.features & FEATURE_BITS[feature])
+    
+    def features_as_set(self) -> Set[AccessibilityFeature]:
+        return set(mask_to_features(self.features))
+    
+    @property
+    def is_sheltered(self) -> bool:
+        return bool(self.features & _SHELTERED_BIT)
+    
+    def get_reverse_edge(self) -> 'Edge':
+        """Returns the reverse direction of this edge"""
+        return Edge(
+            from_node=self.to_node,
+            to_node=self.from_node,
+            distance=self.distance,
+            slope=-self.slope,  # Reverse the slope
+            surface=self.surface,
+            width=self.width,
+            is_bidirectional=self.is_bidirectional,
+            features=self.features,
+            is_accessible=self.is_accessible,
+            blocked_reason=self.blocked_reason,
+            blocked_until=self.blocked_until
+        )
+    
+    def reversed_view(self) -> 'EdgeView':
+        """Lightweight read-only view of this edge traversed from to_node to from_node"""
+        return EdgeView(
+            self.to_node,
+            self.from_node,
+            self.distance,
+            -self.slope,  # Reverse the slope
+            self.surface,
+            self.width,
+            self.is_bidirectional,
+            self.features,
+            self.is_accessible,
+            self.blocked_reason,
+            self.blocked_until
+        )
+    
+    def to_dict(self) -> dict:
+        """JSON-ready dict; the result is cached, so treat it as read-only"""
+        cached = self._cached_dict
+        if cached is not None:
+            return cached
+        cached = self._cached_dict = {
+            "from_node": self.from_node,
+            "to_node": self.to_node,
+            "distance": self.distance,
+            "slope": self.slope,
+            "surface": SURFACE_NAMES[self.surface],
+            "width": self.width,
+            "is_bidirectional": self.is_bidirectional,
+            "is_sheltered": self.is_sheltered,
+            "features": FEATURE_NAMES_BY_MASK[self.features],
+            "is_accessible": self.is_accessible,
+            "blocked_reason": self.blocked_reason,
+            "blocked_until": self.blocked_until.isoformat() if self.blocked_until else None
+        }
+        return cached
+    
+    @staticmethod
+    def from_dict(data: dict) -> 'Edge':
+        features = 0
+        for name in data.get("features", ()):
+            features |= FEATURE_BY_NAME[name]
+        # Older files carry shelter only as a separate flag
+        if data.get("is_sheltered"):
+            features |= _SHELTERED_BIT
+        blocked_until = None
+        if data.get("blocked_until"):
+            blocked_until = datetime.fromisoformat(data["blocked_until"])
+        
+        edge = object.__new__(Edge)
+        edge.from_node = data["from_node"]
+        edge.to_node = data["to_node"]
+        edge.distance = data["distance"]
+        edge.slope = data.get("slope", 0.0)
+        edge.surface = SURFACE_NAME_TO_ID[data.get("surface", "smooth_pavement")]
+        edge.width = data.get("width", 2.0)
+        edge.is_bidirectional = data.get("is_bidirectional", True)
+        edge.features = features
+        edge.is_accessible = data.get("is_accessible", True)
+        edge.blocked_reason = data.get("blocked_reason")
+        edge.blocked_until = blocked_until
+        edge._cached_dict = None
+        return edge
+
+
+class EdgeView(NamedTuple):
+    """Reverse traversal of a bidirectional Edge, exposing the same attributes"""
+    from_node: str
+    to_node: str
+    distance: float
+    slope: float
+    surface: int
+    width: float
+    is_bidirectional: bool
+    features: int
+    is_accessible: bool
+    blocked_reason: Optional[str]
+    blocked_until: Optional[datetime]
+    
+    @property
+    def is_sheltered(self) -> bool:
+        return bool(self.features & _SHELTERED_BIT)
+
+
+@dataclass
+class CSRAdjacency:
+    """
+    Compressed sparse row snapshot of the adjacency lists
+    Edges leaving node i occupy slots indptr[i]:indptr[i+1] of the parallel edge arrays
+    """
+    node_ids: List[str]
+    node_index: Dict[str, int]
+    indptr: array  # 'i', one entry per node plus one
+    neighbor_idx: array  # 'i'
+    edge_distance: array  # 'd'
+    edge_slope: array  # 'd'
+    edge_width: array  # 'd'
+    edge_surface_id: array  # 'B', SurfaceType ids
+    edge_features: array  # 'H', see FEATURE_BITS
+    edge_flags: array  # 'B', EDGE_FLAG_* bits
+    edges: List[Union[Edge, EdgeView]]  # Edge (or reversed view of one) per slot
+    # Per-node coordinates in radians and cos(latitude); nan for edge endpoints with no Node
+    node_lat: array  # 'd'
+    node_lon: array  # 'd'
+    node_cos_lat: array  # 'd'
+    # Filled on first use of edge_geo_distance, so rebuilds after edits do not pay for it
+    _edge_geo_distance: Optional[array] = field(default=None, repr=False)
+    
+    @property
+    def edge_geo_distance(self) -> array:
+        """Straight-line length of each edge slot in meters from its endpoints' coordinates ('d')"""
+        geo = self._edge_geo_distance
+        if geo is None:
+            node_lat, node_lon, node_cos_lat = self.node_lat, self.node_lon, self.node_cos_lat
+            indptr, neighbor_idx = self.indptr, self.neighbor_idx
+            geo = array('d')
+            for i in range(len(self.node_ids)):
+                lat1, lon1, cos_lat1 = node_lat[i], node_lon[i], node_cos_lat[i]
+                for k in range(indptr[i], indptr[i + 1]):
+                    j = neighbor_idx[k]
+                    geo.append(haversine_rad(lat1, lon1, cos_lat1, node_lat[j], node_lon[j], node_cos_lat[j]))
+            self._edge_geo_distance = geo
+        return geo
+
+
+class CampusGraph:
+    def __init__(self):
+        self.nodes: Dict[str, Node] = {}
+        self.edges: Dict[str, List[Edge]] = {}  # from_node -> list of edges
+        # to_node -> bidirectional edges arriving there; each edge is stored once and walked
+        # backwards through a reversed view
+        self._incoming: Dict[str, List[Edge]] = {}
+        self.metadata = {
+            "campus_name": "University of Adelaide - North Terrace Campus",
+            "last_updated": datetime.now().isoformat(),
+            "contributors": []
+        }
+        # Guards structural mutation against concurrent snapshotting for persistence
+        self.lock = threading.RLock()
+        # Bumped on every mutation; lets clients and caches tell graph versions apart
+        self._revision = 0
+        # Serialized read-API payloads, rebuilt lazily after any mutation
+        self._nodes_json_cache: Optional[bytes] = None
+        self._statistics_json_cache: Optional[bytes] = None
+        # Running aggregates for get_statistics (counted per directed edge)
+        self._total_distance = 0.0
+        self._edge_count = 0
+        self._blocked_count = 0
+        self._buildings: Counter = Counter()
+        self._csr: Optional[CSRAdjacency] = None
+        # (from_node, to_node) -> directed edges between them, for O(1) block/unblock lookups
+        self._edge_index: Dict[Tuple[str, str], List[Edge]] = {}
+        # Dense integer index per node id (edge endpoints without a Node included), assigned on
+        # first sight and never reassigned; the CSR snapshot is laid out in this order
+        self._node_ids: List[str] = []
+        self._node_index: Dict[str, int] = {}
+    
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled and derived caches are cheaper to rebuild than to store
+        state = self.__dict__.copy()
+        del state['lock']
+        state['_nodes_json_cache'] = None
+        state['_statistics_json_cache'] = None
+        state['_csr'] = None
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+    
+    @property
+    def revision(self) -> int:
+        return self._revision
+    
+    def _invalidate_caches(self) -> None:
+        # Called after each mutation, never before: a reader that rebuilds a cache mid-mutation
+        # would otherwise have it kept. Caches are cleared before the revision moves, so a
+        # reader that sees the new revision cannot get a payload from before the edit
+        self._nodes_json_cache = None
+        self._statistics_json_cache = None
+        self._csr = None
+        self._revision += 1
+    
+    def _index_node(self, node_id: str) -> int:
+        index = self._node_index.get(node_id)
+        if index is None:
+            # Interned so lookups with interned query ids compare by identity
+            node_id = sys.intern(node_id)
+            index = self._node_index[node_id] = len(self._node_ids)
+            self._node_ids.append(node_id)
+        return index
+    
+    def get_node_index(self, node_id: str) -> Optional[int]:
+        """Integer index of a node id, matching get_csr().node_index; None if the id is unknown"""
+        return self._node_index.get(node_id)
+    
+    def add_node(self, node: Node) -> None:
+        """Add a node to the graph"""
+        self._insert_node(node)
+        self._invalidate_caches()
+    
+    def add_nodes_bulk(self, nodes: Iterable[Node]) -> None:
+        """Add many nodes, invalidating the derived caches once rather than per node"""
+        for node in nodes:
+            self._insert_node(node)
+        self._invalidate_caches()
+    
+    def _insert_node(self, node: Node) -> None:
+        self._index_node(node.id)
+        previous = self.nodes.get(node.id)
+        if previous is not None and previous.building:
+            self._buildings[previous.building] -= 1
+            if not self._buildings[previous.building]:
+                del self._buildings[previous.building]
+        if node.building:
+            self._buildings[node.building] += 1
+        
+        self.nodes[node.id] = node
+        if node.id not in self.edges:
+            self.edges[node.id] = []
+    
+    def add_edge(self, edge: Edge) -> None:
+        """Add an edge to the graph; raises ValueError if either endpoint is not a node in the graph"""
+        self._check_endpoints((edge,))
+        self._insert_edge(edge)
+        self._invalidate_caches()
+    
+    def add_edges_bulk(self, edges: Iterable[Edge], require_nodes: bool = True) -> None:
+        """
+        Add many edges, invalidating the derived caches once rather than per edge
+        Raises ValueError, adding nothing, if any edge names a node that is not in the graph,
+        unless require_nodes is False
+        """
+        edges = list(edges)
+        if require_nodes:
+            self._check_endpoints(edges)
+        
+        for edge in edges:
+            self._insert_edge(edge)
+        self._invalidate_caches()
+    
+    def _check_endpoints(self, edges: Iterable[Edge]) -> None:
+        missing = ({edge.from_node for edge in edges} | {edge.to_node for edge in edges}) - self.nodes.keys()
+        if missing:
+            raise ValueError(f"Edges reference unknown nodes: {', '.join(sorted(missing))}")
+    
+    def _insert_edge(self, edge: Edge) -> None:
+        self._index_node(edge.from_node)
+        self._index_node(edge.to_node)
+        if edge.from_node not in self.edges:
+            self.edges[edge.from_node] = []
+        
+        self.edges[edge.from_node].append(edge)
+        self._edge_index.setdefault((edge.from_node, edge.to_node), []).append(edge)
+        
+        directions = 2 if edge.is_bidirectional else 1
+        self._total_distance += edge.distance * directions
+        self._edge_count += directions
+        if not edge.is_accessible:
+            self._blocked_count += directions
+        
+        # Bidirectional edges are also reachable from to_node, without a second Edge object
+        if edge.is_bidirectional:
+            if edge.to_node not in self.edges:
+                self.edges[edge.to_node] = []
+            self._incoming.setdefault(edge.to_node, []).append(edge)
+            self._edge_index.setdefault((edge.to_node, edge.from_node), []).append(edge)
+    
+    def build_csr(self) -> CSRAdjacency:
+        """Rebuild the CSR arrays from the adjacency lists"""
+        with self.lock:
+            revision = self._revision
+            # Copied so a snapshot still in use is unaffected by nodes added after it
+            node_ids = list(self._node_ids)
+            node_index = dict(self._node_index)
+            
+            indptr = array('i', [0])
+            neighbor_idx = array('i')
+            edge_distance = array('d')
+            edge_slope = array('d')
+            edge_width = array('d')
+            edge_surface_id = array('B')
+            edge_features = array('H')
+            edge_flags = array('B')
+            edges = []
+            
+            for node_id in node_ids:
+                outgoing = self.edges.get(node_id, [])
+                incoming = [e.reversed_view() for e in self._incoming.get(node_id, ())]
+                for edge in outgoing + incoming:
+                    neighbor_idx.append(node_index[edge.to_node])
+                    edge_distance.append(edge.distance)
+                    edge_slope.append(edge.slope)
+                    edge_width.append(edge.width)
+                    edge_surface_id.append(edge.surface)
+                    edge_features.append(edge.features)
+                    edge_flags.append(
+                        (EDGE_FLAG_SHELTERED if edge.is_sheltered else 0)
+                        | (EDGE_FLAG_ACCESSIBLE if edge.is_accessible else 0)
+                    )
+                    edges.append(edge)
+                indptr.append(len(edges))
+            
+            node_lat = array('d')
+            node_lon = array('d')
+            for node_id in node_ids:
+                node = self.nodes.get(node_id)
+                node_lat.append(math.radians(node.latitude) if node is not None else math.nan)
+                node_lon.append(math.radians(node.longitude) if node is not None else math.nan)
+            node_cos_lat = array('d', map(math.cos, node_lat))
+            
+            csr = CSRAdjacency(
+                node_ids=node_ids,
+                node_index=node_index,
+                indptr=indptr,
+                neighbor_idx=neighbor_idx,
+                edge_distance=edge_distance,
+                edge_slope=edge_slope,
+                edge_width=edge_width,
+                edge_surface_id=edge_surface_id,
+                edge_features=edge_features,
+                edge_flags=edge_flags,
+                edges=edges,
+                node_lat=node_lat,
+                node_lon=node_lon,
+                node_cos_lat=node_cos_lat
+            )
+            # Not cached if an edit landed during the build (from a caller not holding the lock)
+            if self._revision == revision:
+                self._csr = csr
+            return csr
+    
+    def get_csr(self) -> CSRAdjacency:
+        """Current CSR snapshot, rebuilt lazily after any mutation"""
+        csr = self._csr
+        if csr is None:
+            csr = self.build_csr()
+        return csr
+    
+    def freeze(self) -> CSRAdjacency:
+        """
+        Build the CSR snapshot now rather than on the first search
+        The graph stays editable; any later mutation drops the snapshot and the next search rebuilds it
+        """
+        return self.get_csr()
+    
+    def haversine_all(self, latitude: float, longitude: float) -> List[float]:
+        """
+        Great-circle distance in meters from a point to every node, indexed like get_csr().node_ids
+        Runs over the snapshot's flat coordinate arrays rather than the Node objects
+        """
+        csr = self.get_csr()
+        lat0 = math.radians(latitude)
+        lon0 = math.radians(longitude)
+        cos_lat0 = math.cos(lat0)
+        sin, asin, sqrt = math.sin, math.asin, math.sqrt
+        return [
+            2 * EARTH_RADIUS_M * asin(sqrt(sin((lat - lat0) / 2) ** 2 + cos_lat0 * cos_lat * sin((lon - lon0) / 2) ** 2))
+            for lat, lon, cos_lat in zip(csr.node_lat, csr.node_lon, csr.node_cos_lat)
+        ]
+    
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 1,
+        required_features: int = 0
+    ) -> List[Tuple[str, float]]:
+        """
+        The k nodes closest to a point as (node_id, meters), nearest first
+        Only nodes having every bit of required_features count, e.g. AccessibilityFeature.RAMP
+        """
+        required_features = int(required_features)
+        csr = self.get_csr()
+        nodes = self.nodes
+        candidates = (
+            (distance, node_id)
+            for node_id, distance in zip(csr.node_ids, self.haversine_all(latitude, longitude))
+            if node_id in nodes and nodes[node_id].features & required_features == required_features
+        )
+        return [(node_id, distance) for distance, node_id in nsmallest(k, candidates)]
+    
+    def run_dijkstra_csr(
+        self,
+        start_node_id: str,
+        end_node_id: str,
+        max_slope: float = 8.0,
+        min_width: float = 1.2,
+        weights: Optional[array] = None
+    ) -> Optional[Tuple[List[Union[Edge, EdgeView]], float]]:
+        """
+        Shortest accessible path between two node ids over the CSR arrays
+        weights defaults to edge distance; pass any per-slot cost array to change the metric
+        Returns (edges along the path, total cost) or None if unreachable
+        """
+        csr = self.get_csr()
+        source = csr.node_index.get(start_node_id)
+        target = csr.node_index.get(end_node_id)
+        if source is None or target is None:
+            return None
+        
+        parents, parent_slots, cost = dijkstra_csr(
+            csr.indptr, csr.neighbor_idx,
+            weights if weights is not None else csr.edge_distance,
+            csr.edge_slope, csr.edge_width, csr.edge_flags,
+            source, target, max_slope, min_width,
+            required_flags=EDGE_FLAG_ACCESSIBLE
+        )
+        if cost[target] == float('inf'):
+            return None
+        
+        path = []
+        node = target
+        while node != source:
+            path.append(csr.edges[parent_slots[node]])
+            node = parents[node]
+        path.reverse()
+        return path, cost[target]
+    
+    def get_neighbors(self, node_id: str, accessible_only: bool = True) -> List[Tuple[str, Union[Edge, EdgeView]]]:
+        """
+        Get all neighboring nodes from a given node
+        Returns list of (neighbor_id, edge) tuples
+        """
+        csr = self.get_csr()
+        i = csr.node_index.get(node_id)
+        if i is None:
+            return []
+        
+        node_ids = csr.node_ids
+        neighbor_idx = csr.neighbor_idx
+        edge_flags = csr.edge_flags
+        edges = csr.edges
+        return [
+            (node_ids[neighbor_idx[k]], edges[k])
+            for k in range(csr.indptr[i], csr.indptr[i + 1])
+            if not accessible_only or edge_flags[k] & EDGE_FLAG_ACCESSIBLE
+        ]
+    
+    def _iter_edge_pair(self, a: str, b: str) -> Iterable[Edge]:
+        """Stored edges between a and b in either direction, each yielded once"""
+        seen = set()
+        for edge in self._edge_index.get((a, b), []) + self._edge_index.get((b, a), []):
+            if id(edge) not in seen:
+                seen.add(id(edge))
+                yield edge
+    
+    def mark_path_blocked(self, from_node: str, to_node: str, reason: str, until: Optional[datetime] = None) -> bool:
+        if (from_node, to_node) not in self._edge_index:
+            return False
+        
+        for edge in self._iter_edge_pair(from_node, to_node):
+            if edge.is_accessible:
+                self._blocked_count += 2 if edge.is_bidirectional else 1
+            edge.is_accessible = False
+            edge.blocked_reason = reason
+            edge.blocked_until = until
+            edge._cached_dict = None
+        self._invalidate_caches()
+        return True
+    
+    def mark_path_accessible(self, from_node: str, to_node: str) -> bool:
+        """Mark a path as accessible again"""
+        if (from_node, to_node) not in self._edge_index:
+            return False
+        
+        for edge in self._iter_edge_pair(from_node, to_node):
+            if not edge.is_accessible:
+                self._blocked_count -= 2 if edge.is_bidirectional else 1
+            edge.is_accessible = True
+            edge.blocked_reason = None
+            edge.blocked_until = None
+            edge._cached_dict = None
+        self._invalidate_caches()
+        return True
+    
+    def save_to_file(self, filename: str) -> None:
+        """
+        Write the graph to disk atomically (temp file + rename)
+        The per-record dicts are collected under the lock (they are memoized, so this is cheap);
+        only the byte encoding happens outside it
+        """
+        with self.lock:
+            # to_dict() stores its result on the record, so it must not run concurrently with an
+            # edit that clears that cache, or the pre-edit dict would be kept and saved forever
+            metadata = dict(self.metadata)
+            node_dicts = [node.to_dict() for node in self.nodes.values()]
+            
+            # Only save one direction of bidirectional edges to avoid duplication
+            edge_dicts = []
+            seen_pairs = set()
+            for edge_list in self.edges.values():
+                for edge in edge_list:
+                    pair = tuple(sorted([edge.from_node, edge.to_node]))
+                    if pair not in seen_pairs or not edge.is_bidirectional:
+                        edge_dicts.append(edge.to_dict())
+                        if edge.is_bidirectional:
+                            seen_pairs.add(pair)
+        
+        tmp_filename = filename + ".tmp"
+        with open(tmp_filename, 'wb') as f:
+            # Stream one record at a time rather than building the whole document in memory
+            f.write(b'{"metadata":')
+            f.write(orjson.dumps(metadata, default=_json_default))
+            
+            f.write(b',"nodes":[')
+            for i, node_dict in enumerate(node_dicts):
+                if i:
+                    f.write(b',')
+                f.write(orjson.dumps(node_dict, default=_json_default))
+            
+            f.write(b'],"edges":[')
+            for i, edge_dict in enumerate(edge_dicts):
+                if i:
+                    f.write(b',')
+                f.write(orjson.dumps(edge_dict, default=_json_default))
+            f.write(b']}')
+        os.replace(tmp_filename, filename)
+    
+    @staticmethod
+    def load_from_file(filename: str) -> 'CampusGraph':
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read())
+        
+        graph = CampusGraph()
+        graph.metadata = data.get("metadata", graph.metadata)
+        
+        graph.add_nodes_bulk(Node.from_dict(node_data) for node_data in data.get("nodes", []))
+        # Files saved before endpoints were validated may hold edges to missing nodes; keep loading
+        # them (build_csr gives such endpoints nan coordinates) rather than failing at startup
+        graph.add_edges_bulk((Edge.from_dict(edge_data) for edge_data in data.get("edges", [])),
+                             require_nodes=False)
+        
+        return graph
+    
+    def get_nodes_json(self) -> bytes:
+        """JSON list of all nodes, cached until the graph changes"""
+        cached = self._nodes_json_cache
+        if cached is None:
+            # Built under the lock so it cannot interleave with an edit made under it; kept only
+            # if no edit landed meanwhile (from a caller not holding the lock)
+            with self.lock:
+                revision = self._revision
+                cached = orjson.dumps([node.to_dict() for node in self.nodes.values()])
+                if self._revision == revision:
+                    self._nodes_json_cache = cached
+        return cached
+    
+    def get_statistics_json(self) -> bytes:
+        """JSON form of get_statistics(), cached until the graph changes"""
+        cached = self._statistics_json_cache
+        if cached is None:
+            with self.lock:
+                revision = self._revision
+                cached = orjson.dumps(self.get_statistics())
+                if self._revision == revision:
+                    self._statistics_json_cache = cached
+        return cached
+    
+    def get_statistics(self) -> dict:
+        """Campus summary built from counters maintained on every mutation"""
+        return {
+            "total_nodes": len(self.nodes),
+            "total_edges": self._edge_count // 2,
+            "total_distance_km": round(self._total_distance / 2 / 1000, 2),  # Divide by 2 for bidirectional edges
+            "blocked_paths": self._blocked_count,
+            "buildings": len(self._buildings)
+        }
@@ -0,0 +1,49 @@
+"""
+4-ary min-heap on a plain list, as a drop-in for heapq.heappush/heappop
+"""
+
+from typing import Any, List
+
+ARITY = 4
+
+
+def heappush4(heap: List[Any], item: Any) -> None:
+    """Push item onto heap, maintaining the 4-ary heap invariant"""
+    heap.append(item)
+    pos = len(heap) - 1
+    while pos > 0:
+        parent = (pos - 1) >> 2
+        parent_item = heap[parent]
+        if not item < parent_item:
+            break
+        heap[pos] = parent_item
+        pos = parent
+    heap[pos] = item
+
+
+def heappop4(heap: List[Any]) -> Any:
+    """Pop and return the smallest item from heap"""
+    last = heap.pop()
+    if not heap:
+        return last
+    smallest = heap[0]
+
+    # Sift the former last item down from the root, moving the smallest child up each level
+    n = len(heap)
+    pos = 0
+    while True:
+        first = (pos << 2) + 1
+        if first >= n:
+            break
+        child = first
+        child_item = heap[first]
+        for c in range(first + 1, min(first + ARITY, n)):
+            if heap[c] < child_item:
+                child = c
+                child_item = heap[c]
+        if not child_item < last:
+            break
+        heap[pos] = child_item
+        pos = child
+    heap[pos] = last
+    return smallest
@@ -0,0 +1,261 @@
+"""
+Shortest-path searches over the flat CSR arrays built by CampusGraph.build_csr
+"""
+
+from array import array
+from heapq import heappush, heappop
+from typing import List, Optional, Sequence, Tuple
+
+from .dary_heap import heappush4, heappop4
+
+# heapq's binary heap is implemented in C and beats the pure-Python 4-ary heap at
+# campus sizes; flip this to compare on larger graphs
+USE_DARY_HEAP = False
+
+
+class SearchWorkspace:
+    """
+    Per-node buffers reused across searches on graphs with the same node count
+    Only the entries a search touched are reset before the next one, so a
+    short search on a large graph does not pay O(n) to start
+    """
+
+    __slots__ = ("n", "cost", "parents", "parent_slots", "settled", "touched",
+                 "cost_b", "parents_b", "parent_slots_b", "settled_b", "touched_b")
+
+    def __init__(self, n: int):
+        self.n = n
+        # Forward search buffers, also used by dijkstra_csr
+        self.cost = [float('inf')] * n
+        self.parents = array('i', [-1]) * n
+        self.parent_slots = array('i', [-1]) * n
+        self.settled = bytearray(n)
+        self.touched: List[int] = []
+        # Backward buffers for bidirectional_csr
+        self.cost_b = [float('inf')] * n
+        self.parents_b = array('i', [-1]) * n
+        self.parent_slots_b = array('i', [-1]) * n
+        self.settled_b = bytearray(n)
+        self.touched_b: List[int] = []
+
+    def reset(self) -> None:
+        """Clear what the previous search wrote; parent entries are only read where cost is finite"""
+        inf = float('inf')
+        for cost, settled, touched in ((self.cost, self.settled, self.touched),
+                                       (self.cost_b, self.settled_b, self.touched_b)):
+            for i in touched:
+                cost[i] = inf
+                settled[i] = 0
+            touched.clear()
+
+
+def passable_mask(
+    slope: Sequence[float],
+    width: Sequence[float],
+    flags: Sequence[int],
+    max_slope: float,
+    min_width: float,
+    required_flags: int = 0
+) -> bytearray:
+    """One byte per edge slot: 1 where the edge is usable under these limits"""
+    return bytearray(
+        1 if f & required_flags == required_flags and abs(s) <= max_slope and w >= min_width else 0
+        for s, w, f in zip(slope, width, flags)
+    )
+
+
+def _workspace_for(workspace: Optional[SearchWorkspace], n: int) -> SearchWorkspace:
+    if workspace is None or workspace.n != n:
+        return SearchWorkspace(n)
+    workspace.reset()
+    return workspace
+
+
+def dijkstra_csr(
+    indptr: Sequence[int],
+    neighbor_idx: Sequence[int],
+    weight: Sequence[float],
+    slope: Sequence[float],
+    width: Sequence[float],
+    flags: Sequence[int],
+    source: int,
+    target: int,
+    max_slope: float,
+    min_width: float,
+    required_flags: int = 0,
+    potential: Optional[Sequence[float]] = None,
+    workspace: Optional[SearchWorkspace] = None,
+    passable: Optional[Sequence[int]] = None
+) -> Tuple[array, array, List[float]]:
+    """
+    Single-source shortest paths on integer node indices
+
+    Edges steeper than max_slope, narrower than min_width or missing any of
+    required_flags are skipped; pass a precomputed passable_mask for those
+    limits to avoid rebuilding it on every call. The search stops as soon as target is settled
+    (pass -1 to settle every reachable node).
+
+    With a consistent potential (a lower bound on the cost to target per node)
+    nodes are settled in order of cost + potential, which makes this A*.
+
+    Returns (parents, parent_slots, cost): predecessor node and CSR edge slot
+    per node (meaningful only where cost is finite) and the best known cost
+    per node. When a workspace is passed these are its buffers, valid until
+    the workspace is used again.
+    """
+    n = len(indptr) - 1
+    inf = float('inf')
+    ws = _workspace_for(workspace, n)
+    cost = ws.cost
+    parents = ws.parents
+    parent_slots = ws.parent_slots
+    settled = ws.settled
+    touched = ws.touched
+    h = potential if potential is not None else [0.0] * n
+    if passable is None:
+        passable = passable_mask(slope, width, flags, max_slope, min_width, required_flags)
+    push, pop = (heappush4, heappop4) if USE_DARY_HEAP else (heappush, heappop)
+
+    cost[source] = 0.0
+    touched.append(source)
+    heap = [(h[source], source)]
+    while heap:
+        _, u = pop(heap)
+        if settled[u]:
+            continue
+        settled[u] = 1
+        if u == target:
+            break
+        d = cost[u]
+
+        for k in range(indptr[u], indptr[u + 1]):
+            if not passable[k]:
+                continue
+            v = neighbor_idx[k]
+            if settled[v]:
+                continue
+            nd = d + weight[k]
+            cv = cost[v]
+            if nd < cv:
+                if cv == inf:
+                    touched.append(v)
+                cost[v] = nd
+                parents[v] = u
+                parent_slots[v] = k
+                push(heap, (nd + h[v], v))
+
+    return parents, parent_slots, cost
+
+
+def bidirectional_csr(
+    indptr: Sequence[int],
+    neighbor_idx: Sequence[int],
+    rev_indptr: Sequence[int],
+    rev_neighbor_idx: Sequence[int],
+    rev_slot: Sequence[int],
+    weight: Sequence[float],
+    slope: Sequence[float],
+    width: Sequence[float],
+    flags: Sequence[int],
+    source: int,
+    target: int,
+    max_slope: float,
+    min_width: float,
+    required_flags: int = 0,
+    potential: Optional[Sequence[float]] = None,
+    workspace: Optional[SearchWorkspace] = None,
+    passable: Optional[Sequence[int]] = None
+) -> Tuple[int, array, array, array, array]:
+    """
+    Bidirectional Dijkstra (A* with a potential) between source and target
+
+    The rev_* arrays list the incoming edges of every node as forward CSR
+    slots, so the backward search reads the same per-slot weight and limits.
+    The forward search is keyed on cost + potential and the backward one on
+    cost - potential; with a consistent potential the search can stop once
+    the two heap tops sum to at least the best meeting cost found.
+
+    Returns (meet, parents_f, slots_f, parents_b, slots_b): the node where the
+    best path joins (-1 when unreachable), forward predecessors and slots
+    from source, and backward successors and slots towards target.
+    """
+    n = len(indptr) - 1
+    inf = float('inf')
+    h = potential if potential is not None else [0.0] * n
+    if passable is None:
+        passable = passable_mask(slope, width, flags, max_slope, min_width, required_flags)
+    push, pop = (heappush4, heappop4) if USE_DARY_HEAP else (heappush, heappop)
+
+    ws = _workspace_for(workspace, n)
+    cost_f, parents_f, slots_f, settled_f, touched_f = (
+        ws.cost, ws.parents, ws.parent_slots, ws.settled, ws.touched)
+    cost_b, parents_b, slots_b, settled_b, touched_b = (
+        ws.cost_b, ws.parents_b, ws.parent_slots_b, ws.settled_b, ws.touched_b)
+
+    cost_f[source] = 0.0
+    cost_b[target] = 0.0
+    touched_f.append(source)
+    touched_b.append(target)
+    heap_f = [(h[source], source)]
+    heap_b = [(-h[target], target)]
+    best = 0.0 if source == target else inf
+    meet = source if source == target else -1
+
+    while heap_f or heap_b:
+        top_f = heap_f[0][0] if heap_f else inf
+        top_b = heap_b[0][0] if heap_b else inf
+        if top_f + top_b >= best:
+            break
+
+        # Grow the smaller frontier
+        if heap_f and (not heap_b or len(heap_f) <= len(heap_b)):
+            _, u = pop(heap_f)
+            if settled_f[u]:
+                continue
+            settled_f[u] = 1
+            d = cost_f[u]
+            for k in range(indptr[u], indptr[u + 1]):
+                if not passable[k]:
+                    continue
+                v = neighbor_idx[k]
+                if settled_f[v]:
+                    continue
+                nd = d + weight[k]
+                cv = cost_f[v]
+                if nd < cv:
+                    if cv == inf:
+                        touched_f.append(v)
+                    cost_f[v] = nd
+                    parents_f[v] = u
+                    slots_f[v] = k
+                    push(heap_f, (nd + h[v], v))
+                    if nd + cost_b[v] < best:
+                        best = nd + cost_b[v]
+                        meet = v
+        else:
+            _, u = pop(heap_b)
+            if settled_b[u]:
+                continue
+            settled_b[u] = 1
+            d = cost_b[u]
+            for r in range(rev_indptr[u], rev_indptr[u + 1]):
+                k = rev_slot[r]
+                if not passable[k]:
+                    continue
+                v = rev_neighbor_idx[r]
+                if settled_b[v]:
+                    continue
+                nd = d + weight[k]
+                cv = cost_b[v]
+                if nd < cv:
+                    if cv == inf:
+                        touched_b.append(v)
+                    cost_b[v] = nd
+                    parents_b[v] = u
+                    slots_b[v] = k
+                    push(heap_b, (nd - h[v], v))
+                    if nd + cost_f[v] < best:
+                        best = nd + cost_f[v]
+                        meet = v
+
+    return meet, parents_f, slots_f, parents_b, slots_b
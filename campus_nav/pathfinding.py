@@ -0,0 +1,688 @@
+import itertools
+import sys
+from array import array
+from typing import List, Dict, Optional, Tuple, Callable, Sequence, Union
+from dataclasses import dataclass, field
+from enum import Enum
+from math import inf
+
+from .campus_graph import (
+    CampusGraph, CSRAdjacency, Node, Edge, EdgeView, AccessibilityFeature, SurfaceType, FEATURE_BITS,
+    FEATURE_NAMES_BY_MASK, SURFACE_NAMES, EDGE_FLAG_ACCESSIBLE
+)
+from .dijkstra_csr import SearchWorkspace, dijkstra_csr, bidirectional_csr, passable_mask
+
+
+class RoutingPreference(Enum):
+    SHORTEST = "shortest"  # Minimize distance
+    FLATTEST = "flattest"  # Minimize slope changes
+    MOST_SHELTERED = "most_sheltered"  # Maximize sheltered paths
+    WITH_REST_STOPS = "with_rest_stops"  # Prefer routes with rest areas
+    BALANCED = "balanced"  # Balance multiple factors
+
+
+# Human-readable surface names and feature lists for directions, formatted once
+_SURFACE_LABELS = tuple(name.replace('_', ' ') for name in SURFACE_NAMES)
+_FEATURE_LABELS_BY_MASK = tuple(
+    ", ".join(name.replace('_', ' ') for name in names) for names in FEATURE_NAMES_BY_MASK
+)
+
+
+@dataclass(slots=True)
+class RouteSegment:
+    from_node: Node
+    to_node: Node
+    edge: Edge
+    cumulative_distance: float
+    cumulative_elevation_change: float
+
+
+@dataclass(slots=True)
+class Route:
+    segments: List[RouteSegment]
+    total_distance: float
+    total_elevation_gain: float
+    total_elevation_loss: float
+    sheltered_percentage: float
+    rest_stops: List[Node]
+    estimated_time_minutes: float
+    accessibility_score: float
+    _directions_cache: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def get_turn_by_turn_directions(self) -> List[str]:
+        if self._directions_cache is not None:
+            return self._directions_cache
+        
+        directions = []
+        
+        for i, segment in enumerate(self.segments):
+            direction = f"{i+1}. From {segment.from_node.name} to {segment.to_node.name}"
+            
+            # Add distance
+            direction += f" ({segment.edge.distance:.0f}m)"
+            
+            # Add slope info
+            if abs(segment.edge.slope) > 2:
+                slope_desc = "uphill" if segment.edge.slope > 0 else "downhill"
+                direction += f" - {slope_desc} ({abs(segment.edge.slope):.1f}% grade)"
+            
+            # Add surface info
+            if segment.edge.surface != SurfaceType.SMOOTH_PAVEMENT:
+                direction += f" - {_SURFACE_LABELS[segment.edge.surface]}"
+            
+            # Add features
+            if segment.edge.features:
+                direction += f" - Features: {_FEATURE_LABELS_BY_MASK[segment.edge.features]}"
+            
+            directions.append(direction)
+        
+        # Add summary
+        summary = f"\nTotal distance: {self.total_distance:.0f}m (~{self.estimated_time_minutes:.0f} min)"
+        if self.total_elevation_gain > 1:
+            summary += f"\nElevation gain: {self.total_elevation_gain:.1f}m"
+        if self.sheltered_percentage > 50:
+            summary += f"\n{self.sheltered_percentage:.0f}% of route is sheltered"
+        if self.rest_stops:
+            summary += f"\nRest stops available: {len(self.rest_stops)}"
+        
+        directions.append(summary)
+        self._directions_cache = directions
+        return directions
+    
+    def to_dict(self) -> dict:
+        return {
+            "segments": [
+                {
+                    "from": seg.from_node.to_dict(),
+                    "to": seg.to_node.to_dict(),
+                    "distance": seg.edge.distance,
+                    "slope": seg.edge.slope,
+                    "surface": SURFACE_NAMES[seg.edge.surface],
+                    "features": FEATURE_NAMES_BY_MASK[seg.edge.features],
+                    "is_sheltered": seg.edge.is_sheltered
+                }
+                for seg in self.segments
+            ],
+            "summary": {
+                "total_distance": self.total_distance,
+                "total_elevation_gain": self.total_elevation_gain,
+                "total_elevation_loss": self.total_elevation_loss,
+                "sheltered_percentage": self.sheltered_percentage,
+                "estimated_time_minutes": self.estimated_time_minutes,
+                "accessibility_score": self.accessibility_score,
+                "rest_stops_count": len(self.rest_stops)
+            },
+            "directions": self.get_turn_by_turn_directions()
+        }
+
+
+# Surface penalty multipliers, based on real wheelchair/mobility aid experiences
+_SURFACE_PENALTY = {
+    SurfaceType.SMOOTH_PAVEMENT: 1.0,      # Ideal
+    SurfaceType.INDOOR_TILE: 1.0,          # Ideal, smooth
+    SurfaceType.INDOOR_CARPET: 1.15,       # Slightly harder to push through
+    SurfaceType.ROUGH_PAVEMENT: 1.35,      # Cracks and bumps
+    SurfaceType.BRICK: 1.6,                # Bumpy, gaps between bricks
+    SurfaceType.GRAVEL: 2.5,               # Very difficult for wheelchairs
+    SurfaceType.GRASS: 3.0                 # Often impassable when wet
+}
+
+_HANDRAILS_BIT = FEATURE_BITS[AccessibilityFeature.HANDRAILS]
+_REST_AREA_BIT = FEATURE_BITS[AccessibilityFeature.REST_AREA]
+
+# Accessibility score deductions per surface id, and the number of features in each mask
+_SURFACE_SCORE_PENALTY = tuple(
+    20 if surface in (SurfaceType.GRAVEL, SurfaceType.GRASS)
+    else 10 if surface in (SurfaceType.BRICK, SurfaceType.ROUGH_PAVEMENT)
+    else 0
+    for surface in SurfaceType
+)
+_FEATURE_COUNT_BY_MASK = tuple(len(names) for names in FEATURE_NAMES_BY_MASK)
+
+
+def _cost_shortest(edge: Edge) -> float:
+    # Simple distance-based cost, but still penalize very steep slopes
+    if abs(edge.slope) > 5:
+        return edge.distance * (1 + abs(edge.slope) / 20)
+    return edge.distance
+
+
+def _cost_flattest(edge: Edge) -> float:
+    # Heavily penalize slopes - this is critical for wheelchair users
+    # Exponential penalty for steeper slopes
+    slope = abs(edge.slope)
+    if slope < 1:
+        slope_penalty = 1.0  # No penalty for nearly flat
+    elif slope < 3:
+        slope_penalty = 1.5  # Mild penalty
+    elif slope < 5:
+        slope_penalty = 2.5  # Moderate penalty
+    elif slope < 7:
+        slope_penalty = 4.0  # Strong penalty
+    else:
+        slope_penalty = 8.0  # Very strong penalty (still passable but avoid)
+    
+    # Additional penalty for going uphill vs downhill
+    direction_penalty = 1.0
+    if edge.slope > 0:  # Uphill is harder
+        direction_penalty = 1.5
+    
+    surface_penalty = _SURFACE_PENALTY.get(edge.surface, 1.0)
+    
+    return edge.distance * slope_penalty * direction_penalty * surface_penalty
+
+
+def _cost_most_sheltered(edge: Edge) -> float:
+    # Strongly prefer sheltered paths
+    shelter_penalty = 1.0 if edge.is_sheltered else 3.0
+    
+    # Still consider slope somewhat
+    slope_consideration = 1.0
+    if abs(edge.slope) > 5:
+        slope_consideration = 1.5
+    
+    return edge.distance * shelter_penalty * slope_consideration
+
+
+def _cost_with_rest_stops(edge: Edge) -> float:
+    # Prefer routes with rest stops, but this is handled more in route selection
+    # Still penalize difficult terrain
+    slope_penalty = 1.0 + (abs(edge.slope) ** 1.2) / 15
+    surface_penalty = _SURFACE_PENALTY.get(edge.surface, 1.0)
+    return edge.distance * slope_penalty * surface_penalty
+
+
+def _cost_balanced(edge: Edge) -> float:
+    # Balance all factors with realistic weights
+    slope = abs(edge.slope)
+    
+    # Slope penalty (progressive)
+    if slope < 2:
+        slope_penalty = 1.0
+    elif slope < 4:
+        slope_penalty = 1.3
+    elif slope < 6:
+        slope_penalty = 1.8
+    else:
+        slope_penalty = 2.5
+    
+    # Uphill is harder than downhill
+    if edge.slope > 3:
+        slope_penalty *= 1.3
+    elif edge.slope < -3:
+        slope_penalty *= 0.9  # Downhill is slightly easier
+    
+    # Surface quality matters
+    surface_penalty = _SURFACE_PENALTY.get(edge.surface, 1.0)
+    
+    # Shelter bonus
+    shelter_bonus = 0.85 if edge.is_sheltered else 1.0
+    
+    # Bonus for paths with handrails on slopes
+    handrail_bonus = 1.0
+    if slope > 3 and edge.features & _HANDRAILS_BIT:
+        handrail_bonus = 0.9
+    
+    return edge.distance * slope_penalty * surface_penalty * shelter_bonus * handrail_bonus
+
+
+# Cost function per preference, resolved once per search instead of branching per edge
+_COST_FNS: Dict[RoutingPreference, Callable[[Edge], float]] = {
+    RoutingPreference.SHORTEST: _cost_shortest,
+    RoutingPreference.FLATTEST: _cost_flattest,
+    RoutingPreference.MOST_SHELTERED: _cost_most_sheltered,
+    RoutingPreference.WITH_REST_STOPS: _cost_with_rest_stops,
+    RoutingPreference.BALANCED: _cost_balanced,
+}
+
+
+# Preferences routed with bidirectional A*; the others use the one-directional search
+_BIDIRECTIONAL_PREFERENCES = frozenset({RoutingPreference.SHORTEST, RoutingPreference.BALANCED})
+
+# Preferences answered from cached shortest-path trees (when enabled); WITH_REST_STOPS always searches
+_TREE_PREFERENCES = frozenset({
+    RoutingPreference.SHORTEST,
+    RoutingPreference.FLATTEST,
+    RoutingPreference.MOST_SHELTERED,
+    RoutingPreference.BALANCED,
+})
+# Cached trees are bounded by total node entries (~40 B each: a cost float plus two int slots),
+# so the cap holds whatever the graph size
+_MAX_CACHED_TREE_NODES = 1_000_000
+_MAX_CACHED_MASKS = 256
+
+
+@dataclass
+class _SearchTables:
+    """Caches derived from one CSR snapshot of the graph"""
+    csr: CSRAdjacency
+    edge_costs: Dict[RoutingPreference, array] = field(default_factory=dict)  # per CSR slot
+    landmark_distances: Dict[RoutingPreference, List[Tuple[List[float], List[float]]]] = field(default_factory=dict)
+    # (preference, node index, towards) -> ALT bound per node index
+    landmark_bounds: Dict[Tuple[RoutingPreference, int, bool], List[float]] = field(default_factory=dict)
+    reverse: Optional[Tuple[array, array, array]] = None  # incoming-edge CSR, see _get_reverse_adjacency
+    passable: Dict[Tuple[float, float], bytearray] = field(default_factory=dict)  # (max_slope, min_width) -> per slot
+    # (preference, source, max_slope, min_width) -> (parents, parent_slots, cost) from dijkstra_csr
+    trees: Dict[Tuple[RoutingPreference, int, float, float], Tuple[array, array, List[float]]] = field(
+        default_factory=dict
+    )
+
+
+class MultiCriteriaRouter:
+    """
+    Multi-criteria pathfinding router using A* algorithm with customizable cost functions
+    """
+    
+    def __init__(self, campus_graph: CampusGraph, cache_trees: bool = False):
+        self.graph = campus_graph
+        # Opt-in: keep an exact shortest-path tree per start node for static preferences instead of
+        # searching per query. Tree answers ignore epsilon and skip the bidirectional search
+        self.cache_trees = cache_trees
+        self._tables: Optional[_SearchTables] = None
+    
+    def _get_tables(self) -> '_SearchTables':
+        """
+        Search caches for the graph's current CSR snapshot
+        Every edit produces a new snapshot, which starts with empty caches; a search keeps
+        using the snapshot it started on, so concurrent edits cannot mix tables
+        """
+        csr = self.graph.get_csr()
+        tables = self._tables
+        if tables is None or tables.csr is not csr:
+            tables = self._tables = _SearchTables(csr)
+        return tables
+    
+    def _get_edge_costs(self, tables: '_SearchTables', preference: RoutingPreference) -> array:
+        """
+        Cost of every CSR edge slot under a preference (inf where blocked)
+        Costs depend only on the edge and the preference, so they are computed once per snapshot
+        """
+        costs = tables.edge_costs.get(preference)
+        if costs is None:
+            cost_fn = _COST_FNS[preference]
+            costs = array('d', [
+                cost_fn(edge) if edge.is_accessible else inf
+                for edge in tables.csr.edges
+            ])
+            tables.edge_costs[preference] = costs
+        return costs
+    
+    def _select_landmarks(self, node_ids: List[str]) -> List[str]:
+        """The northern, southern, western and eastern extremes of the campus"""
+        nodes = [self.graph.nodes[node_id] for node_id in node_ids if node_id in self.graph.nodes]
+        if not nodes:
+            return []
+        
+        landmarks = []
+        for key in (lambda n: n.latitude, lambda n: -n.latitude, lambda n: n.longitude, lambda n: -n.longitude):
+            node_id = min(nodes, key=key).id
+            if node_id not in landmarks:
+                landmarks.append(node_id)
+        return landmarks
+    
+    @staticmethod
+    def _dijkstra_all(indptr: array, neighbor_idx: array, weight: array, passable: bytearray, source: int) -> List[float]:
+        """Cost from source to every node index (inf where unreachable), via the CSR kernel"""
+        _, _, cost = dijkstra_csr(indptr, neighbor_idx, weight, (), (), (), source, -1, inf, 0.0, passable=passable)
+        return cost
+    
+    def _get_landmark_distances(
+        self, tables: '_SearchTables', preference: RoutingPreference
+    ) -> List[Tuple[List[float], List[float]]]:
+        """
+        Exact costs from and to each landmark under a preference, over every accessible edge
+        Per-query slope/width limits only remove edges, so these stay lower bounds for any query
+        """
+        landmark_distances = tables.landmark_distances.get(preference)
+        if landmark_distances is None:
+            csr = tables.csr
+            costs = self._get_edge_costs(tables, preference)
+            accessible = bytearray(1 if f & EDGE_FLAG_ACCESSIBLE else 0 for f in csr.edge_flags)
+            # The backward searches walk the reverse CSR, so gather costs and passability per reverse slot
+            rev_indptr, rev_neighbor_idx, rev_slot = self._get_reverse_adjacency(tables)
+            rev_costs = array('d', [costs[k] for k in rev_slot])
+            rev_accessible = bytearray(accessible[k] for k in rev_slot)
+            
+            landmark_distances = [
+                (self._dijkstra_all(csr.indptr, csr.neighbor_idx, costs, accessible, csr.node_index[landmark]),
+                 self._dijkstra_all(rev_indptr, rev_neighbor_idx, rev_costs, rev_accessible, csr.node_index[landmark]))
+                for landmark in self._select_landmarks(csr.node_ids)
+            ]
+            tables.landmark_distances[preference] = landmark_distances
+        return landmark_distances
+    
+    def _precompute_heuristic_to(
+        self, tables: '_SearchTables', target: int, preference: RoutingPreference
+    ) -> List[float]:
+        """
+        ALT lower bound on the cost from every node index to target in one pass
+        By the triangle inequality, cost(n, t) >= d(l, t) - d(l, n) and >= d(n, l) - d(t, l) for every landmark l
+        """
+        return self._landmark_bounds(tables, target, preference, towards=True)
+    
+    def _precompute_heuristic_from(
+        self, tables: '_SearchTables', source: int, preference: RoutingPreference
+    ) -> List[float]:
+        """
+        ALT lower bound on the cost from source to every node index, for searches run backwards
+        cost(s, n) >= d(l, n) - d(l, s) and >= d(s, l) - d(n, l) for every landmark l
+        """
+        return self._landmark_bounds(tables, source, preference, towards=False)
+    
+    def _landmark_bounds(
+        self, tables: '_SearchTables', anchor: int, preference: RoutingPreference, towards: bool
+    ) -> List[float]:
+        bounds = tables.landmark_bounds.get((preference, anchor, towards))
+        if bounds is not None:
+            return bounds
+        
+        bounds = [0.0] * len(tables.csr.node_ids)
+        for from_landmark, to_landmark in self._get_landmark_distances(tables, preference):
+            # Bounds from the anchor are bounds to it with the landmark directions swapped
+            a, b = (from_landmark, to_landmark) if towards else (to_landmark, from_landmark)
+            a_anchor, b_anchor = a[anchor], b[anchor]
+            for i in range(len(bounds)):
+                a_node, b_node = a[i], b[i]
+                if a_anchor < inf and a_node < inf and a_anchor - a_node > bounds[i]:
+                    bounds[i] = a_anchor - a_node
+                if b_node < inf and b_anchor < inf and b_node - b_anchor > bounds[i]:
+                    bounds[i] = b_node - b_anchor
+        
+        tables.landmark_bounds[(preference, anchor, towards)] = bounds
+        return bounds
+    
+    def _get_reverse_adjacency(self, tables: '_SearchTables') -> Tuple[array, array, array]:
+        """
+        Incoming edges per node as (indptr, neighbor_idx, slot) over the forward CSR slots
+        Slot k of node i here is the forward edge slot[k] arriving at i from neighbor_idx[k]
+        """
+        if tables.reverse is None:
+            csr = tables.csr
+            n = len(csr.node_ids)
+            counts = [0] * (n + 1)
+            for j in csr.neighbor_idx:
+                counts[j + 1] += 1
+            indptr = array('i', itertools.accumulate(counts))
+            
+            fill = list(indptr[:n])
+            neighbor_idx = array('i', [0]) * len(csr.neighbor_idx)
+            slot = array('i', [0]) * len(csr.neighbor_idx)
+            for i in range(n):
+                for k in range(csr.indptr[i], csr.indptr[i + 1]):
+                    j = csr.neighbor_idx[k]
+                    neighbor_idx[fill[j]] = i
+                    slot[fill[j]] = k
+                    fill[j] += 1
+            tables.reverse = (indptr, neighbor_idx, slot)
+        return tables.reverse
+    
+    def find_route(
+        self,
+        start_node_id: str,
+        end_node_id: str,
+        preference: RoutingPreference = RoutingPreference.BALANCED,
+        max_slope: float = 8.0,
+        min_width: float = 1.2,
+        epsilon: float = 1.0,
+        workspace: Optional[SearchWorkspace] = None
+    ) -> Optional[Route]:
+        """
+        Find the optimal route using A* algorithm with multi-criteria optimization
+        
+        Args:
+            start_node_id: Starting node ID
+            end_node_id: Destination node ID
+            preference: Routing preference (shortest, flattest, etc.)
+            max_slope: Maximum acceptable slope percentage
+            min_width: Minimum acceptable path width in meters
+            epsilon: Heuristic weight; values above 1 expand fewer nodes but the route
+                may cost up to epsilon times the optimum (useful for quick previews)
+            workspace: Search buffers to reuse across consecutive queries
+        
+        A router created with cache_trees=True answers every preference except WITH_REST_STOPS
+        exactly from a cached shortest-path tree, ignoring epsilon and workspace.
+        
+        Returns:
+            Route object if path found, None otherwise
+        """
+        if start_node_id not in self.graph.nodes or end_node_id not in self.graph.nodes:
+            return None
+        
+        # Ids from requests are fresh strings; interned ones match the snapshot's keys by identity
+        start_node_id = sys.intern(start_node_id)
+        end_node_id = sys.intern(end_node_id)
+        
+        tables = self._get_tables()
+        csr = tables.csr
+        source = csr.node_index.get(start_node_id)
+        target = csr.node_index.get(end_node_id)
+        if source is None or target is None:
+            return None
+        
+        if self.cache_trees and preference in _TREE_PREFERENCES:
+            parents, parent_slots, cost = self._get_shortest_path_tree(
+                tables, source, preference, max_slope, min_width
+            )
+            if cost[target] == inf:
+                return None
+            return self._construct_route(self._reconstruct_path(csr, parents, parent_slots, source, target))
+        
+        # The bidirectional stopping rule needs an exact heuristic weight
+        if preference in _BIDIRECTIONAL_PREFERENCES and source != target and epsilon == 1.0:
+            return self._find_route_bidir(tables, source, target, preference, max_slope, min_width, workspace)
+        
+        heuristic = self._precompute_heuristic_to(tables, target, preference)
+        if epsilon != 1.0:
+            heuristic = [epsilon * h for h in heuristic]
+        
+        # A* is Dijkstra keyed on g + h; the kernel runs it over the flat per-slot arrays
+        parents, parent_slots, cost = dijkstra_csr(
+            csr.indptr, csr.neighbor_idx, self._get_edge_costs(tables, preference),
+            csr.edge_slope, csr.edge_width, csr.edge_flags,
+            source, target, max_slope, min_width,
+            required_flags=EDGE_FLAG_ACCESSIBLE,
+            potential=heuristic,
+            workspace=workspace,
+            passable=self._get_passable(tables, max_slope, min_width)
+        )
+        if cost[target] == inf:
+            return None
+        
+        return self._construct_route(self._reconstruct_path(csr, parents, parent_slots, source, target))
+    
+    def _get_passable(self, tables: '_SearchTables', max_slope: float, min_width: float) -> bytearray:
+        """Per-slot usability under a query's slope/width limits, built once per snapshot and limits"""
+        key = (max_slope, min_width)
+        passable = tables.passable.get(key)
+        if passable is None:
+            csr = tables.csr
+            passable = passable_mask(
+                csr.edge_slope, csr.edge_width, csr.edge_flags,
+                max_slope, min_width, required_flags=EDGE_FLAG_ACCESSIBLE
+            )
+            if len(tables.passable) >= _MAX_CACHED_MASKS:
+                tables.passable.clear()
+            tables.passable[key] = passable
+        return passable
+    
+    def _get_shortest_path_tree(
+        self,
+        tables: '_SearchTables',
+        source: int,
+        preference: RoutingPreference,
+        max_slope: float,
+        min_width: float
+    ) -> Tuple[array, array, List[float]]:
+        """
+        Full Dijkstra tree from source as (parents, parent_slots, cost), computed once per snapshot
+        Later queries from the same start with the same limits are a predecessor walk
+        """
+        key = (preference, source, max_slope, min_width)
+        tree = tables.trees.get(key)
+        if tree is None:
+            csr = tables.csr
+            tree = dijkstra_csr(
+                csr.indptr, csr.neighbor_idx, self._get_edge_costs(tables, preference),
+                csr.edge_slope, csr.edge_width, csr.edge_flags,
+                source, -1, max_slope, min_width,
+                required_flags=EDGE_FLAG_ACCESSIBLE,
+                passable=self._get_passable(tables, max_slope, min_width)
+            )
+            # Limits come from clients, so bound the memory the distinct trees can hold
+            if (len(tables.trees) + 1) * len(csr.node_ids) > _MAX_CACHED_TREE_NODES:
+                tables.trees.clear()
+            tables.trees[key] = tree
+        return tree
+    
+    def _find_route_bidir(
+        self,
+        tables: '_SearchTables',
+        source: int,
+        target: int,
+        preference: RoutingPreference,
+        max_slope: float,
+        min_width: float,
+        workspace: Optional[SearchWorkspace] = None
+    ) -> Optional[Route]:
+        """Bidirectional A* between two node indices, meeting in the middle"""
+        csr = tables.csr
+        to_target = self._precompute_heuristic_to(tables, target, preference)
+        from_source = self._precompute_heuristic_from(tables, source, preference)
+        # Average of the two bounds: a consistent potential for the forward search whose
+        # negation is consistent for the backward one
+        potential = [(t - s) / 2 for t, s in zip(to_target, from_source)]
+        
+        rev_indptr, rev_neighbor_idx, rev_slot = self._get_reverse_adjacency(tables)
+        meet, parents_f, slots_f, parents_b, slots_b = bidirectional_csr(
+            csr.indptr, csr.neighbor_idx, rev_indptr, rev_neighbor_idx, rev_slot,
+            self._get_edge_costs(tables, preference), csr.edge_slope, csr.edge_width, csr.edge_flags,
+            source, target, max_slope, min_width,
+            required_flags=EDGE_FLAG_ACCESSIBLE,
+            potential=potential,
+            workspace=workspace,
+            passable=self._get_passable(tables, max_slope, min_width)
+        )
+        if meet < 0:
+            return None
+        
+        path = self._reconstruct_path(csr, parents_f, slots_f, source, meet)
+        node = meet
+        while node != target:
+            following = parents_b[node]
+            path.append((csr.node_ids[node], csr.node_ids[following], csr.edges[slots_b[node]]))
+            node = following
+        return self._construct_route(path)
+    
+    @staticmethod
+    def _reconstruct_path(
+        csr: CSRAdjacency,
+        parents: Sequence[int],
+        parent_slots: Sequence[int],
+        source: int,
+        target: int
+    ) -> List[Tuple[str, str, Union[Edge, EdgeView]]]:
+        """Walk parent pointers back from the goal into (from_id, to_id, edge) steps"""
+        path = []
+        node = target
+        while node != source:
+            prev = parents[node]
+            path.append((csr.node_ids[prev], csr.node_ids[node], csr.edges[parent_slots[node]]))
+            node = prev
+        path.reverse()
+        return path
+    
+    def _construct_route(self, path: List[Tuple[str, str, Union[Edge, EdgeView]]]) -> Route:
+        """Construct a Route object from the path"""
+        nodes = self.graph.nodes
+        edges = [edge for _, _, edge in path]
+        to_nodes = [nodes[to_id] for _, to_id, _ in path]
+        
+        # Work column-wise: one list per quantity, reduced with sum/accumulate
+        distances = [edge.distance for edge in edges]
+        elevation_changes = [edge.distance * edge.slope / 100 for edge in edges]
+        gains = [change if change > 0 else 0 for change in elevation_changes]
+        losses = [0 if change > 0 else abs(change) for change in elevation_changes]
+        
+        segments = [
+            RouteSegment(
+                from_node=nodes[from_id],
+                to_node=to_node,
+                edge=edge,
+                cumulative_distance=cumulative_distance,
+                cumulative_elevation_change=cumulative_gain - cumulative_loss
+            )
+            for (from_id, _, edge), to_node, cumulative_distance, cumulative_gain, cumulative_loss in zip(
+                path, to_nodes, itertools.accumulate(distances),
+                itertools.accumulate(gains), itertools.accumulate(losses)
+            )
+        ]
+        
+        total_distance = sum(distances)
+        total_elevation_gain = sum(gains)
+        total_elevation_loss = sum(losses)
+        sheltered_distance = sum(distance for distance, edge in zip(distances, edges) if edge.is_sheltered)
+        rest_stops = [node for node in to_nodes if node.features & _REST_AREA_BIT]
+        
+        # Calculate metrics
+        sheltered_percentage = (sheltered_distance / total_distance * 100) if total_distance > 0 else 0
+        
+        # Estimate time (assuming ~3 km/h for accessible walking with mobility aids)
+        # Adjust for slope
+        base_time_hours = total_distance / 3000
+        slope_adjustment = (total_elevation_gain / 10) / 60  # Add time for elevation
+        estimated_time_minutes = (base_time_hours + slope_adjustment) * 60
+        
+        # Calculate accessibility score (0-100, higher is better)
+        accessibility_score = self._calculate_accessibility_score(segments)
+        
+        return Route(
+            segments=segments,
+            total_distance=total_distance,
+            total_elevation_gain=total_elevation_gain,
+            total_elevation_loss=total_elevation_loss,
+            sheltered_percentage=sheltered_percentage,
+            rest_stops=rest_stops,
+            estimated_time_minutes=estimated_time_minutes,
+            accessibility_score=accessibility_score
+        )
+    
+    def _calculate_accessibility_score(self, segments: List[RouteSegment]) -> float:
+        if not segments:
+            return 0
+        
+        # Per segment: penalise steep slopes and poor surfaces, reward shelter and accessibility features
+        score = 100.0 + sum(
+            -(abs(edge.slope) * 3 if abs(edge.slope) > 2 else 0)
+            - _SURFACE_SCORE_PENALTY[edge.surface]
+            + (2 if edge.is_sheltered else 0)
+            + _FEATURE_COUNT_BY_MASK[edge.features] * 2
+            for edge in (segment.edge for segment in segments)
+        )
+        
+        return max(0, min(100, score))
+    
+    def find_alternative_routes(
+        self,
+        start_node_id: str,
+        end_node_id: str,
+        num_alternatives: int = 3,
+        epsilon: float = 1.0
+    ) -> List[Route]:
+        """One route per preference; epsilon is passed on to find_route"""
+        routes = []
+        preferences = [
+            RoutingPreference.SHORTEST,
+            RoutingPreference.FLATTEST,
+            RoutingPreference.MOST_SHELTERED,
+            RoutingPreference.BALANCED
+        ]
+        
+        # One set of search buffers serves every preference; each search resets only what it touched.
+        # Cached trees do not search per query, so the buffers are only needed without them
+        workspace = None if self.cache_trees else SearchWorkspace(len(self._get_tables().csr.node_ids))
+        for preference in preferences[:num_alternatives]:
+            route = self.find_route(start_node_id, end_node_id, preference, epsilon=epsilon, workspace=workspace)
+            if route:
+                routes.append((preference, route))
+        
+        return routes
@@ -0,0 +1,72 @@
+"""
+Debounced background persistence for the campus graph
+"""
+
+import gzip
+import os
+import threading
+from typing import Optional
+
+from .campus_graph import CampusGraph
+
+
+class PersistenceWriter:
+    """
+    Coalesces graph mutations into a single background save
+    Request handlers call schedule_save() (O(1)); the full write happens on a timer thread
+    """
+
+    def __init__(self, graph: CampusGraph, filename: str, delay: float = 0.5, gzip_mirror: bool = True):
+        self.graph = graph
+        self.filename = filename
+        self.delay = delay  # coalescing window in seconds
+        self.gzip_mirror = gzip_mirror  # also keep filename + ".gz" for compressed downloads
+        self._dirty = threading.Event()
+        self._timer: Optional[threading.Timer] = None
+        self._timer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def schedule_save(self) -> None:
+        """Mark the graph dirty and start the debounce timer if not already running"""
+        with self._timer_lock:
+            self._dirty.set()
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._timer_lock:
+            self._timer = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the graph now if there are unsaved changes"""
+        with self._write_lock:
+            if not self._dirty.is_set():
+                return
+            self._dirty.clear()
+            try:
+                self.graph.save_to_file(self.filename)
+                if self.gzip_mirror:
+                    self._write_gzip_mirror()
+            except Exception:
+                # Keep the changes pending so the next flush retries
+                self._dirty.set()
+                raise
+
+    def _write_gzip_mirror(self) -> None:
+        with open(self.filename, 'rb') as f:
+            compressed = gzip.compress(f.read())
+        tmp_filename = self.filename + ".gz.tmp"
+        with open(tmp_filename, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp_filename, self.filename + ".gz")
+
+    def close(self) -> None:
+        """Cancel any pending timer and flush outstanding changes"""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self.flush()
@@ -28,6 +28,16 @@ except ImportError as e:
     print(f"  Fix: pip install flask-cors")
     sys.exit(1)
 
+# Check orjson
+try:
+    import orjson
+    print("✓ orjson installed")
+except ImportError as e:
+    print(f"✗ orjson NOT installed")
+    print(f"  Error: {e}")
+    print(f"  Fix: pip install orjson")
+    sys.exit(1)
+
 # Check project structure
 import os
 print("\n" + "="*60)
@@ -35,10 +45,13 @@ print("PROJECT STRUCTURE CHECK")
 print("="*60)
 
 required_files = [
-    "src/campus_graph.py",
-    "src/pathfinding.py",
-    "src/sample_data.py",
+    "campus_nav/__init__.py",
+    "campus_nav/campus_graph.py",
+    "campus_nav/pathfinding.py",
+    "campus_nav/sample_data.py",
     "data/north_terrace_campus.json",
+    "data/north_terrace_nodes.csv",
+    "data/north_terrace_edges.csv",
     "templates/index.html",
     "app.py",
     "demo.py",
@@ -58,17 +71,15 @@ print("\n" + "="*60)
 print("MODULE IMPORT CHECK")
 print("="*60)
 
-sys.path.insert(0, 'src')
-
 try:
-    from campus_graph import CampusGraph, Node, Edge
+    from campus_nav.campus_graph import CampusGraph, Node, Edge
     print("✓ campus_graph module imports successfully")
 except ImportError as e:
     print(f"✗ campus_graph import failed: {e}")
     all_present = False
 
 try:
-    from pathfinding import MultiCriteriaRouter, RoutingPreference
+    from campus_nav.pathfinding import MultiCriteriaRouter, RoutingPreference
     print("✓ pathfinding module imports successfully")
 except ImportError as e:
     print(f"✗ pathfinding import failed: {e}")
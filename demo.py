@@ -2,11 +2,8 @@
 Demo script to test the accessible campus navigation system
 """
 
-import sys
-sys.path.insert(0, 'src')
-
-from campus_graph import CampusGraph
-from pathfinding import MultiCriteriaRouter, RoutingPreference
+from campus_nav.campus_graph import CampusGraph
+from campus_nav.pathfinding import MultiCriteriaRouter, RoutingPreference
 
 
 def print_route_summary(route, preference_name):
@@ -8,7 +8,7 @@ echo.
 echo 1. Checking Python installation...
 python --version >nul 2>&1
 if %errorlevel% neq 0 (
-    echo X Python not found. Please install Python 3.8+
+    echo X Python not found. Please install Python 3.10+
     echo Download from: https://www.python.org/downloads/
     pause
     exit /b 1
@@ -13,7 +13,7 @@ elif command -v python &> /dev/null; then
     PYTHON_CMD=python
     echo "✓ Python found: $(python --version)"
 else
-    echo "✗ Python not found. Please install Python 3.8+"
+    echo "✗ Python not found. Please install Python 3.10+"
     exit 1
 fi
 
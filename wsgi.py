@@ -0,0 +1,13 @@
+"""
+WSGI entry point for production servers, e.g.
+
+    gunicorn -w 1 -k gthread --threads 8 wsgi:application
+
+Use one worker process: each worker holds its own campus graph and saves it to
+the same data file, so edits made through different workers overwrite each other.
+"""
+
+from app import app, load_campus_data
+
+load_campus_data()
+application = app